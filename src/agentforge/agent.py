@@ -1,17 +1,42 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import os
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from agentforge.llm import LLM
 from agentforge.utils.functions.Logger import Logger
 from agentforge.utils.function_utils import Functions
+from agentforge.utils.inference_broker import InferenceBroker
+from agentforge.utils.result_writer import ResultWriter
+
+
+# Upper bound on agents a single run_batch call will have in flight against the model provider
+MAX_PARALLEL_AGENTS: int = int(os.getenv('OLLAMA_NUM_PARALLEL', 4))
 
 
 class Agent:
+    # Shared by every instance of an agent class; each subclass gets its own through __init_subclass__
+    agent_name: str = 'Agent'
+    _shared_logger: Optional[Logger] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Gives each agent subclass its own name and logger slot, so instances of the same agent share one logger.
+        The logger itself is created with the first instance, once the configuration is available.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.agent_name = cls.__name__
+        cls._shared_logger = None
+
     def __init__(self):
         """
-        Initializes an Agent instance, setting up its name, logger, data attributes, and agent-specific configurations.
+        Initializes an Agent instance, setting up its logger, data attributes, and agent-specific configurations.
         It attempts to load the agent's configuration data and storage settings.
         """
-        self.agent_name: str = self.__class__.__name__
-        self.logger: Logger = Logger(name=self.agent_name)
+        cls = type(self)
+        if cls._shared_logger is None:
+            cls._shared_logger = Logger(name=cls.agent_name)
+        self.logger: Logger = cls._shared_logger
 
         self.data: Dict[str, Any] = {}
         self.prompt: Optional[List[str]] = None
@@ -21,17 +46,55 @@ class Agent:
         if not hasattr(self, 'agent_data'):  # Prevent re-initialization
             self.agent_data: Optional[Dict[str, Any]] = None
 
+        # Language model and call arguments, resolved once per loaded agent_data instead of on every LLM call
+        self._llm: Optional[LLM] = None
+        self._llm_kwargs: Dict[str, Any] = {}
+        self._llm_source: Optional[Dict[str, Any]] = None
+
+        # Results queued by save_result that have not been written yet; finished writes drop out on their own
+        self._pending_saves: 'weakref.WeakSet[Future]' = weakref.WeakSet()
+
         try:
-            self.functions: Functions = Functions()
+            self.functions: Functions = Functions.instance()
         except Exception as e:
             self.logger.log(f"Error during initialization of {self.agent_name}: {e}", 'error')
             raise
 
     def run(self, **kwargs: Any) -> Optional[str]:
+        """
+        Synchronous entry point to the agent's workflow. Runs the asynchronous workflow in `arun` to completion on a
+        fresh event loop, so existing callers keep working unchanged. When called from code already running inside an
+        event loop (e.g. a discord.py handler), the fresh loop is run on a worker thread and this call blocks until it
+        finishes, just as the synchronous workflow did.
+
+        Parameters:
+            **kwargs (Any): Keyword arguments that will form part of the agent's data.
+
+        Returns:
+            Optional[str]: The output generated by the agent or None if an error occurred during execution.
+        """
+        try:
+            asyncio.get_running_loop()
+            loop_running = True
+        except RuntimeError:
+            loop_running = False
+
+        # Run outside the except block, so the 'no running event loop' error is not the active exception for the
+        # whole agent run
+        if not loop_running:
+            return asyncio.run(self.arun(**kwargs))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(self.arun(**kwargs))).result()
+
+    async def arun(self, **kwargs: Any) -> Optional[str]:
         """
         Orchestrates the execution of the agent's workflow: loading data, processing data, generating prompts,
         running language models, parsing results, saving results, and building the output.
 
+        The language model call and the storage step are awaited, so many agents can be driven concurrently with
+        `asyncio.gather` (see `run_batch`) and overlap their network I/O.
+
         Parameters:
             **kwargs (Any): Keyword arguments that will form part of the agent's data.
 
@@ -40,12 +103,12 @@ class Agent:
         """
         try:
             self.logger.log(f"\n{self.agent_name} - Running...", 'info')
-            self.load_data(**kwargs)
+            await self.aload_data(**kwargs)
             self.process_data()
             self.generate_prompt()
-            self.run_llm()
+            await self.arun_llm()
             self.parse_result()
-            self.save_to_storage()
+            await self.asave_to_storage()
             self.build_output()
             self.data = {}
             self.logger.log(f"\n{self.agent_name} - Done!", 'info')
@@ -55,6 +118,31 @@ class Agent:
 
         return self.output
 
+    @staticmethod
+    async def run_batch(agents: Iterable['Agent'], inputs: Iterable[Dict[str, Any]],
+                        max_parallel: int = MAX_PARALLEL_AGENTS) -> List[Optional[str]]:
+        """
+        Runs several agents concurrently, pairing each agent with the keyword arguments at the same position in
+        `inputs`. At most `max_parallel` agents are in flight at any time.
+
+        Each agent instance keeps per-run state, so the same instance should not appear twice in one batch.
+
+        Parameters:
+            agents (Iterable[Agent]): The agents to run.
+            inputs (Iterable[Dict[str, Any]]): The keyword arguments for each agent's run.
+            max_parallel (int): The maximum number of agents running at once.
+
+        Returns:
+            List[Optional[str]]: The outputs of the agents, in the same order as the agents were given.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def bounded_run(agent: 'Agent', kwargs: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                return await agent.arun(**kwargs)
+
+        return list(await asyncio.gather(*(bounded_run(agent, kwargs) for agent, kwargs in zip(agents, inputs))))
+
     def load_data(self, **kwargs: Any) -> None:
         """
         Central method for data loading that orchestrates the loading of agent data, persona-specific data,
@@ -69,6 +157,25 @@ class Agent:
         self.load_from_storage()
         self.load_additional_data()
 
+    async def aload_data(self, **kwargs: Any) -> None:
+        """
+        Awaitable counterpart of `load_data`. Runs the same steps in the same order, since each step may read what the
+        previous ones put in `self.data`. The steps that read configuration files or storage run in worker threads so
+        the event loop stays free for other agents. Agents that override `load_data` keep their override.
+
+        Parameters:
+            **kwargs (Any): Keyword arguments for additional data loading.
+        """
+        if type(self).load_data is not Agent.load_data:
+            await asyncio.to_thread(self.load_data, **kwargs)
+            return
+
+        self.load_kwargs(**kwargs)
+        await asyncio.to_thread(self.load_agent_data)
+        self.load_persona_data()
+        await self._arun_hook(self.load_from_storage)
+        await self._arun_hook(self.load_additional_data)
+
     def load_kwargs(self, **kwargs: Any) -> None:
         """
         Loads the variables passed to the agent as data.
@@ -87,10 +194,10 @@ class Agent:
         Loads the agent's configuration data including parameters and prompts.
         """
         try:
-            self.agent_data = self.functions.agent_utils.load_agent_data(self.agent_name).copy()
+            self.agent_data = self.functions.agent_utils.load_agent_data(self.agent_name)
             self.data.update({
-                'params': self.agent_data.get('params').copy(),
-                'prompts': self.agent_data['prompts'].copy()
+                'params': self.agent_data['params'],
+                'prompts': self.agent_data['prompts']
             })
         except Exception as e:
             self.logger.log(f"Error loading agent data: {e}", 'error')
@@ -131,31 +238,60 @@ class Agent:
         templates and aggregates them into a list.
         """
         try:
-            rendered_prompts: List[str] = []
-            for prompt_template in self.data['prompts'].values():
-                template = self.functions.prompt_handling.handle_prompt_template(prompt_template, self.data)
-                if template:
-                    rendered_prompt = self.functions.prompt_handling.render_prompt_template(template, self.data)
-                    rendered_prompts.append(rendered_prompt)
-
-            self.prompt = rendered_prompts
+            handle = self.functions.prompt_handling.handle_prompt_template
+            render = self.functions.prompt_handling.render_prompt_template
+            data = self.data
+
+            self.prompt = [render(template, data) for template in
+                           (handle(prompt_template, data) for prompt_template in data['prompts'].values())
+                           if template]
         except Exception as e:
             self.logger.log(f"Error generating prompt: {e}", 'error')
             self.prompt = None
 
+    def resolve_llm(self) -> Tuple[LLM, Dict[str, Any]]:
+        """
+        Returns the language model and the arguments to call it with, taken from `self.agent_data`. They are resolved
+        again only when `self.agent_data` has been replaced, which also covers `load_agent_data` overrides.
+
+        Returns:
+            Tuple[LLM, Dict[str, Any]]: The language model instance and its parameters, including the agent name.
+        """
+        if self._llm_source is not self.agent_data:
+            self._llm = self.agent_data['llm']
+            self._llm_kwargs = {**self.agent_data.get('params', {}), 'agent_name': self.agent_name}
+            self._llm_source = self.agent_data
+        return self._llm, self._llm_kwargs
+
     def run_llm(self) -> None:
         """
         Executes the language model generation with the generated prompt(s) and any specified parameters.
         """
         try:
-            model: LLM = self.agent_data['llm']
-            params: Dict[str, Any] = self.agent_data.get("params", {})
-            params['agent_name'] = self.agent_name
+            model, params = self.resolve_llm()
             self.result = model.generate_text(self.prompt, **params).strip()
         except Exception as e:
             self.logger.log(f"Error running LLM: {e}", 'error')
             self.result = None
 
+    async def arun_llm(self) -> None:
+        """
+        Awaitable counterpart of `run_llm`. Generates through `InferenceBroker`, which coalesces prompts arriving from
+        concurrent agents into micro-batches when the model supports batching. Agents that override `run_llm` keep
+        their custom behavior, run in a worker thread.
+        """
+        if type(self).run_llm is not Agent.run_llm:
+            await asyncio.to_thread(self.run_llm)
+            return
+
+        try:
+            model, params = self.resolve_llm()
+            result = await InferenceBroker.generate(self.agent_name, model, self.prompt, params)
+            self.result = result.strip()
+        except Exception as e:
+            self.logger.log(f"Error running LLM: {e}", 'error')
+            self.result = None
+
     def parse_result(self) -> None:
         """
         Placeholder for result parsing. Meant to be overridden by custom agents to implement specific result parsing
@@ -172,6 +308,60 @@ class Agent:
         """
         pass
 
+    def save_result(self) -> None:
+        """
+        Queues the result to be saved to the 'Results' collection of the agent's storage, and returns without waiting
+        for the write. Not called by the default workflow; custom agents can opt in by calling it from
+        `save_to_storage`. Results from agents finishing at about the same time are written together in one batch by
+        the shared `ResultWriter`. Use `await_storage` to wait for the writes to finish.
+        """
+        storage = self.agent_data.get('storage') if self.agent_data else None
+        if storage is None or self.result is None:
+            return
+
+        future = ResultWriter.instance().submit(storage, self.result)
+        future.add_done_callback(self._log_save_error)
+        self._pending_saves.add(future)
+
+    def _log_save_error(self, future: Future) -> None:
+        """
+        Logs the error of a failed result write queued by `save_result`.
+
+        Parameters:
+            future (Future): The finished write.
+        """
+        error = future.exception()
+        if error is not None:
+            self.logger.log(f"Error saving result: {error}", 'error')
+
+    def await_storage(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocks until every result this agent queued with `save_result` has been written, or the timeout expires.
+
+        Parameters:
+            timeout (float, optional): The maximum number of seconds to wait.
+        """
+        wait(list(self._pending_saves), timeout=timeout)
+
+    async def asave_to_storage(self) -> None:
+        """
+        Awaitable counterpart of `save_to_storage`. Runs `save_to_storage` in a worker thread so storage writes do not
+        block the event loop.
+        """
+        await self._arun_hook(self.save_to_storage)
+
+    async def _arun_hook(self, hook: Callable[[], None]) -> None:
+        """
+        Runs a workflow hook in a worker thread. Hooks the agent does not override are placeholders that do nothing,
+        so they are skipped instead of paying for a thread hop.
+
+        Parameters:
+            hook (Callable[[], None]): The bound hook method, e.g. `self.load_from_storage`.
+        """
+        if getattr(type(self), hook.__name__) is getattr(Agent, hook.__name__):
+            return
+        await asyncio.to_thread(hook)
+
     def build_output(self) -> None:
         """
         Constructs the output from the result. This method can be overridden by subclasses to customize the output.
@@ -3,6 +3,10 @@ import os
 import yaml
 import pathlib
 import sys
+import threading
+
+# Use LibYAML's C parser when PyYAML was built with it; it parses the same safe subset, much faster
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 def load_yaml_file(file_path: str):
@@ -21,15 +25,15 @@ def load_yaml_file(file_path: str):
         or an error occurs during parsing, an empty dictionary is returned.
 
     Notes:
-        - The function uses `yaml.safe_load` to prevent execution of arbitrary code
-          that might be present in the YAML file.
+        - The function uses the safe YAML loader (LibYAML's CSafeLoader when available) to prevent
+          execution of arbitrary code that might be present in the YAML file.
         - Exceptions for file not found and YAML parsing errors are caught and logged,
           with an empty dictionary returned to allow the calling code to continue
           execution without interruption.
     """
     try:
         with open(file_path, 'r') as yaml_file:
-            return yaml.safe_load(yaml_file)
+            return yaml.load(yaml_file, Loader=YamlSafeLoader)
     except FileNotFoundError:
         print(f"File {file_path} not found.")
         return {}
@@ -41,6 +45,13 @@ def load_yaml_file(file_path: str):
 class Config:
     _instance = None
 
+    # Incremented every time the configuration files have been (re)loaded, so caches derived from them can detect
+    # changes
+    version = 0
+
+    # Held while the configuration files are (re)loaded, so no thread reads a partially rebuilt configuration
+    lock = threading.RLock()
+
     def __new__(cls, *args, **kwargs):
         """
         Ensures that only one instance of Config exists.
@@ -53,6 +64,16 @@ class Config:
             cls._instance = super(Config, cls).__new__(cls, *args, **kwargs)
         return cls._instance
 
+    @classmethod
+    def instance(cls) -> 'Config':
+        """
+        Returns the shared Config instance, creating and loading it on first use.
+
+        Returns:
+            Config: The singleton instance of the Config class.
+        """
+        return cls._instance if cls._instance is not None else cls()
+
     def __init__(self):
         """
         Initializes the Config object, setting up the project root and configuration path.
@@ -144,18 +165,21 @@ class Config:
         """
         Recursively loads all configuration data from YAML files under each subdirectory of the .agentforge folder.
         """
-        for subdir, dirs, files in os.walk(self.config_path):
-            for file in files:
-                if file.endswith(('.yaml', '.yml')):
-                    subdir_path = pathlib.Path(subdir)
-                    relative_path = subdir_path.relative_to(self.config_path)
-                    nested_dict = self.get_nested_dict(self.data, relative_path.parts)
-
-                    file_path = str(subdir_path / file)
-                    data = load_yaml_file(file_path)
-                    if data:
-                        filename_without_ext = os.path.splitext(file)[0]
-                        nested_dict[filename_without_ext] = data
+        with self.lock:
+            self.config_snapshot = self.snapshot_configurations()
+            for subdir, dirs, files in os.walk(self.config_path):
+                for file in files:
+                    if file.endswith(('.yaml', '.yml')):
+                        subdir_path = pathlib.Path(subdir)
+                        relative_path = subdir_path.relative_to(self.config_path)
+                        nested_dict = self.get_nested_dict(self.data, relative_path.parts)
+
+                        file_path = str(subdir_path / file)
+                        data = load_yaml_file(file_path)
+                        if data:
+                            filename_without_ext = os.path.splitext(file)[0]
+                            nested_dict[filename_without_ext] = data
+            Config.version += 1
 
     def find_file_in_directory(self, directory: str, filename: str):
         """
@@ -241,9 +265,30 @@ class Config:
 
     def reload(self):
         """
-        Reloads configurations for an agent.
+        Reloads configurations for an agent. The YAML files are only re-parsed when one of them was added, removed or
+        modified since the last load.
+        """
+        with self.lock:
+            if self.data['settings']['system']['OnTheFly']:
+                if self.snapshot_configurations() != self.config_snapshot:
+                    self.load_all_configurations()
+
+    def snapshot_configurations(self):
+        """
+        Records the modification time of every YAML file under the .agentforge folder.
+
+        Returns:
+            dict: A mapping of each configuration file path to its modification time in nanoseconds.
         """
-        if self.data['settings']['system']['OnTheFly']:
-            self.load_all_configurations()
+        snapshot = {}
+        for subdir, dirs, files in os.walk(self.config_path):
+            for file in files:
+                if file.endswith(('.yaml', '.yml')):
+                    file_path = os.path.join(subdir, file)
+                    try:
+                        snapshot[file_path] = os.stat(file_path).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+        return snapshot
 
 
@@ -43,7 +43,7 @@ class Actions:
         """
         self.logger = Logger(name=self.__class__.__name__)
         self.storage = ChromaUtils('default')
-        self.functions = Functions()
+        self.functions = Functions.instance()
         self.action_creation = ActionCreationAgent()
         self.action_selection = ActionSelectionAgent()
         self.priming_agent = ToolPrimingAgent()
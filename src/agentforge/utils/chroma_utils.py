@@ -1,5 +1,7 @@
 import os
 import uuid
+import functools
+import threading
 # from pathlib import Path
 from datetime import datetime
 from typing import Optional, Union
@@ -17,6 +19,20 @@ logger = Logger(name="Chroma Utils")
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 
+def synchronized(method):
+    """
+    Runs a ChromaUtils method while holding the instance's lock. Methods that select a collection and then use
+    `self.collection` must not interleave, or a call from another thread (e.g. the ResultWriter storage pool) could
+    switch the selected collection between the two steps.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 def validate_inputs(collection_name: str, data: Union[list, str], ids: list, metadata: list[dict]):
     """
     Validates the inputs for the save_memory method.
@@ -138,6 +154,7 @@ class ChromaUtils:
         upon creation.
         """
         self.persona_name = persona_name
+        self.lock = threading.RLock()
         self.config = Config()
         self.init_embeddings()
         self.init_storage()
@@ -258,6 +275,7 @@ class ChromaUtils:
         """
         return self.client.list_collections()
 
+    @synchronized
     def peek(self, collection_name: str):
         """
         Peeks into a collection to retrieve a brief overview of its contents.
@@ -284,6 +302,7 @@ class ChromaUtils:
             logger.log(f"Error peeking collection: {e}", 'error')
             return None
 
+    @synchronized
     def load_collection(self, collection_name: str, include: dict = None, where: dict = None, where_doc: dict = None):
         """
         Loads data from a specified collection based on provided filters.
@@ -322,6 +341,7 @@ class ChromaUtils:
             data = []
         return data
 
+    @synchronized
     def save_memory(self, collection_name: str, data: Union[list, str], ids: list = None, metadata: list[dict] = None):
         """
         Saves data to memory, creating or updating documents in a specified collection.
@@ -361,6 +381,7 @@ class ChromaUtils:
         except Exception as e:
             raise ValueError(f"Error saving results. Error: {e}\n\nData:\n{data}")
 
+    @synchronized
     def query_memory(self, collection_name: str, query: Optional[Union[str, list]] = None,
                      filter_condition: Optional[dict] = None, include: Optional[list] = None,
                      embeddings: Optional[list] = None, num_results: int = 1):
@@ -503,6 +524,7 @@ class ChromaUtils:
         """
         return self.embedding([text_to_embed])
 
+    @synchronized
     def count_collection(self, collection_name: str):
         """
         Counts the number of documents in a specified collection.
@@ -516,6 +538,7 @@ class ChromaUtils:
         self.select_collection(collection_name)
         return self.collection.count()
 
+    @synchronized
     def search_metadata_min_max(self, collection_name, metadata_tag, min_max):
         """
         Retrieves the collection entry with the minimum or maximum value for the specified metadata tag.
@@ -579,6 +602,7 @@ class ChromaUtils:
             logger.log(f"Error finding max metadata: {e}\nCollection: {collection_name}\nTarget Metadata: {metadata_tag}", 'error')
             return None
 
+    @synchronized
     def delete_memory(self, collection_name, doc_id):
         self.select_collection(collection_name)
         self.collection.delete(ids=[doc_id])
@@ -1,8 +1,5 @@
-from .functions.AgentUtils import AgentUtils
-from .functions.ParsingUtils import ParsingUtils
-from .functions.PromptHandling import PromptHandling
-from .functions.ToolUtils import ToolUtils
-from .functions.UserInterface import UserInterface
+import importlib
+import threading
 from agentforge.utils.functions.Logger import Logger
 
 
@@ -11,12 +8,14 @@ class Functions:
     A class that aggregates various utility functions and classes to provide streamlined access
     to common functionalities across the application.
 
-    This class initializes utility classes related to agent operations, prompt handling,
+    This class provides utility classes related to agent operations, prompt handling,
     tool utilities, and user interface interactions. It serves as a centralized point for accessing
-    these utilities, ensuring that they are readily available throughout the application.
+    these utilities, ensuring that they are readily available throughout the application. Each utility
+    is imported and created the first time it is accessed, so only the utilities actually used are loaded.
 
     Attributes:
         agent_utils (AgentUtils): An instance of the AgentUtils class for agent-related operations.
+        parsing_utils (ParsingUtils): An instance of the ParsingUtils class for parsing model responses.
         prompt_handling (PromptHandling): An instance of the PromptHandling class for managing prompt templates and
         rendering.
         tool_utils (ToolUtils): An instance of the ToolUtils class for tool-related operations and interactions.
@@ -24,20 +23,68 @@ class Functions:
         logger (Logger): An instance of the Logger class for logging information and errors.
     """
 
+    _instance = None
+
+    # Utility attribute names mapped to the module in agentforge.utils.functions and the class that provides them
+    utilities = {
+        'agent_utils': ('AgentUtils', 'AgentUtils'),
+        'parsing_utils': ('ParsingUtils', 'ParsingUtils'),
+        'prompt_handling': ('PromptHandling', 'PromptHandling'),
+        'tool_utils': ('ToolUtils', 'ToolUtils'),
+        'user_interface': ('UserInterface', 'UserInterface'),
+    }
+
     def __init__(self):
         """
-        Initializes the Functions class by creating instances of utility classes and handling any exceptions
-        that occur during their initialization.
+        Initializes the Functions class. Utility classes are not created here, but on first access.
         """
         # self.config = None
         self.logger = Logger(name=self.__class__.__name__)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        """
+        Imports and creates a utility class the first time its attribute is accessed, then stores it on the instance
+        so later accesses skip this method entirely. Utility classes with a shared instance (e.g. UserInterface) are
+        obtained through their `instance()` method.
+
+        Parameters:
+            name (str): The name of the attribute being accessed.
+
+        Returns:
+            object: The utility class instance for the attribute.
+
+        Raises:
+            AttributeError: If the attribute is not a known utility.
+        """
+        if name not in Functions.utilities:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        with self._lock:
+            if name in self.__dict__:
+                return self.__dict__[name]
+
+            module_name, class_name = Functions.utilities[name]
+            try:
+                module = importlib.import_module(f'.functions.{module_name}', package=__package__)
+                utility_class = getattr(module, class_name)
+                utility = getattr(utility_class, 'instance', utility_class)()
+            except Exception as e:
+                self.logger.log(f"Error initializing Functions.{name}: {e}", 'error')
+                raise
+
+            setattr(self, name, utility)
+            return utility
 
-        try:
-            self.agent_utils = AgentUtils()
-            self.parsing_utils = ParsingUtils()
-            self.prompt_handling = PromptHandling()
-            self.tool_utils = ToolUtils()
-            self.user_interface = UserInterface()
-        except Exception as e:
-            self.logger.log(f"Error initializing Functions: {e}", 'error')
-            raise
+    @classmethod
+    def instance(cls) -> 'Functions':
+        """
+        Returns the shared Functions instance, creating it on first use, so agents do not rebuild every utility class
+        each time they are instantiated.
+
+        Returns:
+            Functions: The shared instance of the Functions class.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
@@ -1,5 +1,9 @@
+import copy
+import functools
+from types import MappingProxyType
 from typing import Dict, Any
 from .Logger import Logger
+from .PromptHandling import PromptHandling
 from ...config import Config
 from ..storage_interface import StorageInterface
 
@@ -21,6 +25,7 @@ class AgentUtils:
         self.logger = Logger(name=self.__class__.__name__)
         self.config = Config()
         self.storage_interface = StorageInterface()
+        self.cached_version = Config.version
 
     def load_agent_data(self, agent_name: str) -> Dict[str, Any]:
         """
@@ -39,26 +44,15 @@ class AgentUtils:
             Exception: For general errors encountered during the loading process.
         """
         try:
-            self.config.reload()
-
-            agent = self.config.find_agent_config(agent_name)
-            settings = self.config.data['settings']
-
-            api, model, final_model_params = self.resolve_model_overrides(agent, settings)
-            llm = self.config.get_llm(api, model)
-            persona_data, persona_file = self.load_persona(agent, settings)
-            storage = self.resolve_storage(settings, persona_file)
-
-            return {
-                'name': agent_name,
-                'settings': settings,
-                'llm': llm,
-                'params': final_model_params,
-                'persona': persona_data,
-                'prompts': agent.get('Prompts', {}),
-                'storage': storage,
-            }
-
+            # Hold the config lock so the data is never built from a configuration another thread is reloading
+            with Config.lock:
+                self.config.reload()
+                if self.cached_version != Config.version:
+                    # Entries built from an older configuration can never be hit again, so drop them
+                    self._load_agent_data_cached.cache_clear()
+                    self.cached_version = Config.version
+                agent_data = self._load_agent_data_cached(agent_name, Config.version)
+            return copy.copy(agent_data)
         except FileNotFoundError as e:
             self.logger.log(f"Configuration or persona file not found: {e}", 'critical')
             raise
@@ -69,6 +63,44 @@ class AgentUtils:
             self.logger.log(f"Unexpected error: {e}", 'critical')
             raise
 
+    @functools.lru_cache(maxsize=256)
+    def _load_agent_data_cached(self, agent_name: str, version: int) -> Dict[str, Any]:
+        """
+        Builds the configuration data for an agent. Results are memoized per agent name and configuration version, so
+        the model, persona and storage are only resolved again once the configuration files have been reloaded.
+
+        Parameters:
+            agent_name (str): The name of the agent for which to load configuration data.
+            version (int): The configuration version the data is built from (see `Config.version`).
+
+        Returns:
+            Dict[str, Any]: The agent data shared by every caller until the configuration changes. Its params and
+            prompts are read-only mappings, so callers can use them without copying.
+        """
+        agent = self.config.find_agent_config(agent_name)
+        settings = self.config.data['settings']
+
+        api, model, final_model_params = self.resolve_model_overrides(agent, settings)
+        llm = self.config.get_llm(api, model)
+        persona_data, persona_file = self.load_persona(agent, settings)
+        storage = self.resolve_storage(settings, persona_file)
+        prompts = agent.get('Prompts', {})
+
+        # Compile the prompt templates along with the rest of the cached data, so generate_prompt always hits the cache
+        for template in prompts.values():
+            if isinstance(template, str):
+                PromptHandling.compile_prompt_template(template)
+
+        return {
+            'name': agent_name,
+            'settings': settings,
+            'llm': llm,
+            'params': MappingProxyType(final_model_params),
+            'persona': persona_data,
+            'prompts': MappingProxyType(prompts),
+            'storage': storage,
+        }
+
     @staticmethod
     def resolve_model_overrides(agent: dict, settings: dict) -> tuple[str, str, dict]:
         """
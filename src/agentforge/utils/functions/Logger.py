@@ -1,5 +1,9 @@
 import os
+import sys
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from ...config import Config
 from ...utils.functions.UserInterface import UserInterface
 
@@ -8,8 +12,97 @@ from colorama import init
 init(autoreset=True)
 
 
+# Log level codes, which callers on hot paths can pass instead of level names
+L_DEBUG = logging.DEBUG
+L_INFO = logging.INFO
+L_WARNING = logging.WARNING
+L_ERROR = logging.ERROR
+L_CRITICAL = logging.CRITICAL
+
+# Lowercase level names mapped to their codes. Names are interned so lookups with the literal names used throughout
+# the codebase compare by identity
+_LEVEL_MAP = {sys.intern(name): code for name, code in (
+    ('debug', L_DEBUG),
+    ('info', L_INFO),
+    ('warning', L_WARNING),
+    ('error', L_ERROR),
+    ('critical', L_CRITICAL),
+)}
+
+# Lone surrogates are the only code points that cannot be encoded as UTF-8; map them to '?' like the 'replace' codec
+_SURROGATE_TABLE = {code_point: '?' for code_point in range(0xD800, 0xE000)}
+
+
 def encode_msg(msg):
-    return msg.encode('utf-8', 'replace').decode('utf-8')
+    if msg.isascii():
+        return msg
+    return msg.translate(_SURROGATE_TABLE)
+
+
+# Separator written after every record in the log files
+_SEPARATOR = '\n' + '-' * 61
+
+
+class FastFormatter(logging.Formatter):
+    """
+    A formatter producing '<time> - <level> - <prefix><message><suffix>' lines. The prefix and suffix are fixed
+    strings computed once per handler, so formatting a record is a single f-string instead of interpolating a
+    %-style template through the record's attribute dictionary.
+
+    Attributes:
+        prefix (str): Text inserted before each message.
+        suffix (str): Text appended after each message.
+    """
+
+    def __init__(self, prefix='', suffix='', datefmt='%Y-%m-%d %H:%M:%S'):
+        super().__init__(datefmt=datefmt)
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def format(self, record):
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f'{message}\n{record.exc_text}'
+        if record.stack_info:
+            message = f'{message}\n{self.formatStack(record.stack_info)}'
+        return f'{self.formatTime(record, self.datefmt)} - {record.levelname} - {self.prefix}{message}{self.suffix}'
+
+
+class QueuedHandler(QueueHandler):
+    """
+    A queue handler that stands in for a real (file or console) handler on a logger. Records are put on the shared
+    log queue together with the real handler, which writes them from the listener's background thread, so logging
+    calls never block on I/O.
+
+    Attributes:
+        handler (logging.Handler): The real handler that writes the records.
+    """
+
+    def __init__(self, handler):
+        super().__init__(_LOG_QUEUE)
+        self.handler = handler
+
+    def enqueue(self, record):
+        self.queue.put_nowait((record, self.handler))
+
+
+class RoutingQueueListener(QueueListener):
+    """
+    A queue listener that hands each record to the real handler it was queued for, rather than to every handler.
+    """
+
+    def handle(self, item):
+        record, handler = item
+        handler.handle(record)
+
+
+# A single background thread writes the records queued by every logger, and drains the queue at interpreter exit
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_LISTENER = RoutingQueueListener(_LOG_QUEUE)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
 
 
 class BaseLogger:
@@ -37,15 +130,27 @@ class BaseLogger:
             log_file (str): The name of the file to log messages to.
             log_level (str): The initial log level for the logger.
         """
-        self.config = Config()
-        self.UI = UserInterface()
+        self.config = Config.instance()
+        self.UI = UserInterface.instance()
 
         # Retrieve the logging enabled flag from configuration
         logging_enabled = self.config.data['settings']['system']['Logging']['Enabled']
 
-        level = self._get_level_code(log_level)
+        level = self._get_level_code(log_level.lower())
         self.logger = logging.getLogger(name)
+        # Records are written by this logger's own handlers; passing them up to ancestor loggers would emit them twice
+        self.logger.propagate = False
         self.log_folder = None
+
+        # Maps each level code and name to the method that logs at that level, so log_msg needs a single lookup
+        self._dispatch = {
+            L_DEBUG: self.logger.debug,
+            L_INFO: self.logger.info,
+            L_WARNING: self.logger.warning,
+            L_ERROR: self._error,
+            L_CRITICAL: self._critical,
+        }
+        self._dispatch.update({name: self._dispatch[code] for name, code in _LEVEL_MAP.items()})
         self.log_file = log_file
 
         # Conditional setup based on logging enabled flag
@@ -61,22 +166,18 @@ class BaseLogger:
     @staticmethod
     def _get_level_code(level):
         """
-        Converts a log level as a string to the corresponding logging module level code.
+        Converts a log level to the corresponding logging module level code.
 
         Parameters:
-            level (str): The log level as a string (e.g., 'debug', 'info', 'warning', 'error', 'critical').
+            level (str | int): The lowercase log level name (e.g., 'debug', 'info', 'warning', 'error', 'critical'),
+            or a level code, which is returned as is.
 
         Returns:
-            int: The logging module level code corresponding to the provided string.
-        """
-        level_dict = {
-            'debug': logging.DEBUG,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'error': logging.ERROR,
-            'critical': logging.CRITICAL,
-        }
-        return level_dict.get(level.lower(), logging.INFO)
+            int: The logging module level code corresponding to the provided level.
+        """
+        if isinstance(level, int):
+            return level
+        return _LEVEL_MAP.get(level, logging.INFO)
 
     def _setup_console_handler(self, level):
         """
@@ -86,24 +187,25 @@ class BaseLogger:
             level (int): The logging level to set for the console handler.
         """
 
-        formatter = logging.Formatter(f'%(asctime)s - %(levelname)s - {self.log_file} - %(message)s\n',
-                                      datefmt='%Y-%m-%d %H:%M:%S')
+        formatter = FastFormatter(prefix=f'{self.log_file} - ', suffix='\n')
 
         if self.logger.name in BaseLogger.console_handlers:
             # Use the existing console handler if it's not already added to this logger
             ch = BaseLogger.console_handlers[self.logger.name]
             if ch not in self.logger.handlers:
                 ch.setLevel(level)
-                ch.setFormatter(formatter)
+                ch.handler.setFormatter(formatter)
                 self.logger.addHandler(ch)
             return
 
-        # Console handler for logs
-        ch = logging.StreamHandler()
+        # Console handler for logs, written from the background log thread
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        ch = QueuedHandler(stream_handler)
         ch.setLevel(level)
-        ch.setFormatter(formatter)
 
-        if not any(type(handler) is logging.StreamHandler for handler in self.logger.handlers):
+        if not any(isinstance(handler, QueuedHandler) and type(handler.handler) is logging.StreamHandler
+                   for handler in self.logger.handlers):
             self.logger.addHandler(ch)
 
         BaseLogger.console_handlers[self.logger.name] = ch
@@ -119,28 +221,27 @@ class BaseLogger:
         # Create the Logs folder if it doesn't exist
         self.initialize_logging()
 
-        formatter = logging.Formatter(f'%(asctime)s - %(levelname)s - %(message)s\n'
-                                      '-------------------------------------------------------------',
-                                      datefmt='%Y-%m-%d %H:%M:%S')
+        formatter = FastFormatter(suffix=_SEPARATOR)
 
         if self.log_file in BaseLogger.file_handlers:
             # Use the existing file handler if it's not already added to this logger
             fh = BaseLogger.file_handlers[self.log_file]
             if fh not in self.logger.handlers:
                 fh.setLevel(level)
-                fh.setFormatter(formatter)
+                fh.handler.setFormatter(formatter)
                 self.logger.addHandler(fh)
             return
 
-        # File handler for logs
+        # File handler for logs, written from the background log thread
         log_file_path = f'{self.log_folder}/{self.log_file}'
-        fh = logging.FileHandler(log_file_path, encoding='utf-8')
+        file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        fh = QueuedHandler(file_handler)
         fh.setLevel(level)
-        fh.setFormatter(formatter)
 
         # Check if a similar handler is already attached
-        if not any(isinstance(handler, logging.FileHandler) and handler.baseFilename == fh.baseFilename for handler in
-                   self.logger.handlers):
+        if not any(isinstance(handler, QueuedHandler) and isinstance(handler.handler, logging.FileHandler) and
+                   handler.handler.baseFilename == file_handler.baseFilename for handler in self.logger.handlers):
             self.logger.addHandler(fh)
 
         # Store the file handler in the class-level dictionary
@@ -152,7 +253,8 @@ class BaseLogger:
         """
         # Save the result to a log.txt file in the /Logs/ folder
         self.log_folder = self.config.data['settings']['system']['Logging']['Folder']
-        self.logger.handlers = [h for h in self.logger.handlers if not isinstance(h, logging.StreamHandler)]
+        self.logger.handlers = [h for h in self.logger.handlers
+                                if not isinstance(h, (logging.StreamHandler, QueuedHandler))]
 
         # Create the Logs folder if it doesn't exist
         if not os.path.exists(self.log_folder):
@@ -165,25 +267,34 @@ class BaseLogger:
 
         Parameters:
             msg (str): The message to log.
-            level (str): The level at which to log the message (e.g., 'info', 'debug', 'error').
-        """
-        level_code = self._get_level_code(level)
-
-        if level_code == logging.DEBUG:
-            self.logger.debug(msg)
-        elif level_code == logging.INFO:
-            self.logger.info(msg)
-        elif level_code == logging.WARNING:
-            self.logger.warning(msg)
-        elif level_code == logging.ERROR:
-            self.logger.error(msg)
+            level (str | int): The lowercase level name (e.g., 'info', 'debug', 'error') or level code at which to log
+            the message.
+        """
+        self._dispatch.get(level, self.logger.info)(msg)
+
+    def _error(self, msg):
+        """
+        Logs a message at the error level, followed by the traceback of the exception being handled, if any.
+
+        Parameters:
+            msg (str): The message to log.
+        """
+        self.logger.error(msg)
+        if sys.exc_info()[0] is not None:
             self.logger.exception("Exception Error Occurred!")
-        elif level_code == logging.CRITICAL:
-            self.logger.critical(msg)
+
+    def _critical(self, msg):
+        """
+        Logs a message at the critical level, followed by the traceback of the exception being handled, and re-raises
+        that exception.
+
+        Parameters:
+            msg (str): The message to log.
+        """
+        self.logger.critical(msg)
+        if sys.exc_info()[0] is not None:
             self.logger.exception("Critical Exception Occurred!")
-            raise
-        else:
-            raise ValueError(f'Invalid log level: {level}')
+        raise
 
     def set_level(self, level):
         """
@@ -192,7 +303,7 @@ class BaseLogger:
         Parameters:
             level (str): The new log level to set (e.g., 'info', 'debug', 'error').
         """
-        level_code = self._get_level_code(level)
+        level_code = self._get_level_code(level.lower() if isinstance(level, str) else level)
         self.logger.setLevel(level_code)
         for handler in self.logger.handlers:
             handler.setLevel(level_code)
@@ -234,7 +345,7 @@ class Logger:
         if self._initialized:
             return
 
-        self.config = Config()
+        self.config = Config.instance()
         self.caller_name = name  # This will store the __name__ of the script that instantiated the Logger
 
         # Retrieve the logging configuration from the config data
@@ -249,24 +360,47 @@ class Logger:
 
         self._initialized = True
 
-    def log(self, msg: str, level: str = 'info', logger_file: str = 'AgentForge'):
+    def log(self, msg: str, level: str | int = 'info', logger_file: str = 'AgentForge'):
         """
         Logs a message to a specified logger or all loggers.
 
         Parameters:
             msg (str): The message to log.
-            level (str): The log level (e.g., 'info', 'debug', 'error').
+            level (str | int): The lowercase log level name (e.g., 'info', 'debug', 'error') or level code.
             logger_file (str): The specific logger to use, or 'all' to log to all loggers.
         """
-        # Prepend the caller's module name to the log message
-        msg_with_caller = f'[{self.caller_name}]\n{msg}'
-
         if logger_file not in self.loggers:
             raise ValueError(f"Unknown logger file '{logger_file}' - Make sure the file name is a Logging File in "
                              f"the configuration file (system.yaml).")
 
+        if not self._is_enabled(logger_file, level):
+            return
+
+        # Prepend the caller's module name to the log message
+        msg_with_caller = f'[{self.caller_name}]\n{msg}'
+
         self.loggers[logger_file].log_msg(msg_with_caller, level)
 
+    def _is_enabled(self, logger_file: str, level: str | int) -> bool:
+        """
+        Checks whether a message at the given level would be emitted by the specified logger, so callers can skip
+        building messages that would be discarded. Unknown logger files report True so that `log` raises as usual.
+
+        Parameters:
+            logger_file (str): The specific logger to check.
+            level (str | int): The lowercase log level name (e.g., 'info', 'debug', 'error') or level code.
+
+        Returns:
+            bool: True if the message should be built and logged, False otherwise.
+        """
+        if logger_file not in self.loggers:
+            return True
+
+        level_code = BaseLogger._get_level_code(level)
+
+        # Critical messages re-raise the active exception, so they must reach the base logger even when it is disabled
+        return level_code == logging.CRITICAL or self.loggers[logger_file].logger.isEnabledFor(level_code)
+
     def log_prompt(self, prompt: str):
         """
         Logs a prompt to the model interaction logger.
@@ -274,7 +408,8 @@ class Logger:
         Parameters:
             prompt (str): The prompt to log.
         """
-        self.log(f'Prompt:\n{prompt}', 'debug', 'ModelIO')
+        if self._is_enabled('ModelIO', L_DEBUG):
+            self.log(f'Prompt:\n{prompt}', L_DEBUG, 'ModelIO')
 
     def log_response(self, response: str):
         """
@@ -283,7 +418,8 @@ class Logger:
         Parameters:
             response (str): The model response to log.
         """
-        self.log(f'Model Response:\n{response}', 'debug', 'ModelIO')
+        if self._is_enabled('ModelIO', L_DEBUG):
+            self.log(f'Model Response:\n{response}', L_DEBUG, 'ModelIO')
 
     def parsing_error(self, model_response: str, error: Exception):
         """
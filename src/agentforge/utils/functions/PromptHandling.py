@@ -1,4 +1,5 @@
 import re
+import functools
 from .Logger import Logger
 
 
@@ -14,6 +15,7 @@ class PromptHandling:
 
     # Define a pattern to find all occurrences of {variable_name}
     pattern = r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}"
+    variable_pattern = re.compile(pattern)
 
     def __init__(self):
         """
@@ -21,6 +23,23 @@ class PromptHandling:
         """
         self.logger = Logger(name=self.__class__.__name__)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def compile_prompt_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        Splits a prompt template into its literal text and variable names. Results are memoized by template string, so
+        each template is only scanned once no matter how many times it is checked or rendered.
+
+        Parameters:
+            template (str): The prompt template containing variables within curly braces.
+
+        Returns:
+            tuple: The variable names in order of appearance, and the template parts, where every odd-indexed part is
+            a variable name and every even-indexed part is literal text.
+        """
+        parts = tuple(PromptHandling.variable_pattern.split(template))
+        return parts[1::2], parts
+
     def extract_prompt_variables(self, template: str) -> list:
         """
         Extracts variable names from a prompt template.
@@ -35,7 +54,7 @@ class PromptHandling:
             Exception: Logs an error message if an exception occurs during the extraction process.
         """
         try:
-            return re.findall(self.pattern, template)
+            return list(self.compile_prompt_template(template)[0])
         except Exception as e:
             self.logger.log(f"Error extracting prompt variables: {e}", 'error')
             return []
@@ -56,7 +75,7 @@ class PromptHandling:
             Exception: Logs an error message if an exception occurs during the process.
         """
         try:
-            required_vars = self.extract_prompt_variables(prompt_template)
+            required_vars = self.compile_prompt_template(prompt_template)[0]
 
             if not required_vars:
                 return prompt_template
@@ -83,13 +102,12 @@ class PromptHandling:
             Exception: Logs an error message if an exception occurs during the rendering process.
         """
         try:
-            def replacement_function(match):
-                variable_name = match.group(1)
-                result = data.get(variable_name, match.group(0))
-                return str(result)
+            _, parts = self.compile_prompt_template(template)
+            rendered = list(parts)
+            for i in range(1, len(parts), 2):
+                rendered[i] = str(data.get(parts[i], f"{{{parts[i]}}}"))
 
-            variable_pattern = re.compile(self.pattern)
-            prompt = variable_pattern.sub(replacement_function, template)
+            prompt = ''.join(rendered)
 
             return prompt
         except Exception as e:
@@ -15,6 +15,8 @@ class UserInterface:
         mode_thread (threading.Thread): A thread for handling mode switching.
     """
 
+    _instance = None
+
     def __init__(self):
         """
         Initializes the UserInterface class with the default mode set to 'manual'.
@@ -22,6 +24,18 @@ class UserInterface:
         self.mode = 'manual'
         self.mode_thread = None
 
+    @classmethod
+    def instance(cls) -> 'UserInterface':
+        """
+        Returns the shared UserInterface instance, creating it on first use.
+
+        Returns:
+            UserInterface: The shared instance of the UserInterface class.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def get_user_input(self):
         """
         Prompts the user for input in manual mode, offering options to continue, switch to auto mode, exit,
@@ -0,0 +1,192 @@
+import asyncio
+import uuid
+import weakref
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+class InferenceRequest(NamedTuple):
+    """A single prompt waiting in the broker queue, keyed by the agent that submitted it."""
+    key: Tuple[str, str]
+    model: Any
+    prompt: List[str]
+    params: Dict[str, Any]
+    future: asyncio.Future
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple:
+    """
+    Builds a hashable key from the sampling parameters of a request, ignoring the agent name, so requests that share
+    the same model settings can be dispatched together.
+    """
+    return tuple(sorted((name, repr(value)) for name, value in params.items() if name != 'agent_name'))
+
+
+class InferenceBroker:
+    """
+    Coalesces concurrent language model requests into micro-batches.
+
+    Agents submit their prompts to a bounded queue. A background task collects up to `max_batch_size` requests,
+    waiting at most `batch_timeout` seconds after the first one arrives, groups them by model and sampling
+    parameters, and sends each group to the model's `generate_batch(prompts, **params)` in a single call. The
+    results are matched back to the requests by index.
+
+    Only models that expose `generate_batch` go through the queue. Use `InferenceBroker.generate()`, which sends
+    prompts for any other model straight to its `agenerate_text` coroutine when available, or to `generate_text` in
+    a worker thread, without paying the batching delay.
+
+    One broker exists per running event loop; use `InferenceBroker.instance()` to get it. The broker is dropped once
+    its loop shuts down and cancels the dispatch task.
+
+    Attributes:
+        max_batch_size (int): The maximum number of requests collected into one batch.
+        batch_timeout (float): How long, in seconds, to wait for more requests once the first one has arrived.
+        max_queue_size (int): The maximum number of requests waiting in the queue before `submit` blocks.
+    """
+
+    max_batch_size: int = 8
+    batch_timeout: float = 0.005
+    max_queue_size: int = 256
+
+    _instances: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, InferenceBroker]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, max_batch_size: Optional[int] = None, batch_timeout: Optional[float] = None,
+                 max_queue_size: Optional[int] = None):
+        """
+        Initializes the broker with an empty request queue. The dispatch task is started on the first submission.
+
+        Parameters:
+            max_batch_size (int, optional): Overrides the class-level maximum batch size.
+            batch_timeout (float, optional): Overrides the class-level batch timeout.
+            max_queue_size (int, optional): Overrides the class-level queue bound.
+        """
+        self.max_batch_size = max_batch_size or self.max_batch_size
+        self.batch_timeout = self.batch_timeout if batch_timeout is None else batch_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size or self.max_queue_size)
+        self._worker: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def instance(cls) -> 'InferenceBroker':
+        """
+        Returns the broker bound to the currently running event loop, creating it if needed.
+
+        Returns:
+            InferenceBroker: The broker for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        broker = cls._instances.get(loop)
+        if broker is None:
+            broker = cls()
+            cls._instances[loop] = broker
+        return broker
+
+    @classmethod
+    async def generate(cls, agent_name: str, model: Any, prompt: List[str], params: Dict[str, Any]) -> Optional[str]:
+        """
+        Generates text for a prompt, batching it with concurrent requests when the model supports it.
+
+        Parameters:
+            agent_name (str): The name of the agent submitting the prompt.
+            model (Any): The language model instance to generate with.
+            prompt (List[str]): The rendered prompt segments.
+            params (Dict[str, Any]): The generation parameters for the model.
+
+        Returns:
+            Optional[str]: The text generated by the model.
+        """
+        if hasattr(model, 'generate_batch'):
+            return await cls.instance().submit(agent_name, model, prompt, params)
+        if hasattr(model, 'agenerate_text'):
+            return await model.agenerate_text(prompt, **params)
+        return await asyncio.to_thread(model.generate_text, prompt, **params)
+
+    async def submit(self, agent_name: str, model: Any, prompt: List[str], params: Dict[str, Any]) -> Optional[str]:
+        """
+        Queues a prompt for generation and waits for its result.
+
+        Parameters:
+            agent_name (str): The name of the agent submitting the prompt.
+            model (Any): The language model instance to generate with.
+            prompt (List[str]): The rendered prompt segments.
+            params (Dict[str, Any]): The generation parameters for the model.
+
+        Returns:
+            Optional[str]: The text generated by the model.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(InferenceRequest((agent_name, uuid.uuid4().hex), model, prompt, params, future))
+        return await future
+
+    async def _collect(self) -> List[InferenceRequest]:
+        """
+        Waits for the first queued request, then keeps collecting until the batch is full or the timeout expires.
+
+        Returns:
+            List[InferenceRequest]: The collected batch.
+        """
+        batch = [await self.queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_timeout
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """
+        Background task that turns the request queue into grouped dispatches. Unregisters the broker when the task
+        is cancelled at loop shutdown.
+        """
+        try:
+            while True:
+                batch = await self._collect()
+
+                groups: Dict[Tuple, List[InferenceRequest]] = {}
+                for request in batch:
+                    groups.setdefault((id(request.model), _params_key(request.params)), []).append(request)
+
+                for group in groups.values():
+                    task = asyncio.create_task(self._dispatch(group))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        finally:
+            loop = asyncio.get_running_loop()
+            if self._instances.get(loop) is self:
+                del self._instances[loop]
+
+    @staticmethod
+    async def _dispatch(group: List[InferenceRequest]) -> None:
+        """
+        Sends a group of requests sharing one model and parameter set to the model's `generate_batch` and resolves
+        their futures.
+
+        Parameters:
+            group (List[InferenceRequest]): The requests to dispatch.
+        """
+        model = group[0].model
+        params = {name: value for name, value in group[0].params.items() if name != 'agent_name'}
+
+        try:
+            results = await asyncio.to_thread(model.generate_batch, [r.prompt for r in group], **params)
+            if len(results) != len(group):
+                raise ValueError(f"generate_batch returned {len(results)} results for {len(group)} prompts")
+        except Exception as e:
+            results = [e] * len(group)
+
+        for request, result in zip(group, results):
+            if request.future.done():
+                continue
+            if isinstance(result, BaseException):
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
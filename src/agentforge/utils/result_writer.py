@@ -0,0 +1,179 @@
+import atexit
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Storage writes (vector DB embedding and HTTP/SQLite round-trips) run here, off both the agent and the writer threads
+_STORAGE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ResultWriter')
+
+
+class ResultWriter:
+    """
+    A write-back buffer that coalesces agent results into batched `save_memory` calls.
+
+    Results are queued together with the storage they belong to. A background thread collects up to `max_batch_size`
+    results, waiting at most `flush_interval` seconds after the first one arrives, and writes each storage's share of
+    the batch to its 'Results' collection with a single `save_memory` call. This amortizes the embedding and database
+    round-trip across every agent that finished within the interval. The writes themselves run on a small thread pool,
+    so a slow storage backend does not hold up collecting the next batch. Storage utilities must therefore be safe to
+    call from several threads; ChromaUtils serializes its collection access with a per-instance lock.
+
+    The writer runs on its own thread rather than an event loop, so results submitted from `Agent.run` (which closes
+    its event loop on return) are still written. Pending results are flushed at interpreter exit.
+
+    Attributes:
+        max_batch_size (int): The maximum number of results written in one pass.
+        flush_interval (float): How long, in seconds, to wait for more results once the first one has arrived.
+        collection_name (str): The storage collection results are written to.
+    """
+
+    max_batch_size: int = 32
+    flush_interval: float = 0.05
+    collection_name: str = 'Results'
+
+    _instance: Optional['ResultWriter'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Initializes the writer with an empty queue. The background thread is started on the first submission.
+        """
+        self.queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._writes: Set[Future] = set()
+        self._writes_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> 'ResultWriter':
+        """
+        Returns the shared ResultWriter, creating it on first use.
+
+        Returns:
+            ResultWriter: The shared instance of the ResultWriter class.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.flush)
+            return cls._instance
+
+    def submit(self, storage: Any, result: str) -> Future:
+        """
+        Queues a result to be saved to the given storage.
+
+        Parameters:
+            storage (Any): The storage utility to save the result with.
+            result (str): The result to save.
+
+        Returns:
+            Future: Resolves once the batch containing the result has been written, or holds the error raised
+            while writing it.
+        """
+        future: Future = Future()
+        self.queue.put((storage, result, future))
+
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return future
+
+    def flush(self) -> None:
+        """
+        Blocks until every result submitted so far has been written.
+        """
+        self.queue.join()
+        with self._writes_lock:
+            writes = list(self._writes)
+        wait(writes)
+
+    def _collect(self) -> List[Tuple[Any, str, Future]]:
+        """
+        Waits for the first queued result, then keeps collecting until the batch is full or the interval expires.
+
+        Returns:
+            List[Tuple[Any, str, Future]]: The collected batch.
+        """
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        """
+        Background loop that writes queued results in batches.
+        """
+        while True:
+            batch = self._collect()
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write(self, batch: List[Tuple[Any, str, Future]]) -> None:
+        """
+        Hands a batch of results to the storage pool, one `save_memory` call per storage.
+
+        Parameters:
+            batch (List[Tuple[Any, str, Future]]): The results to write.
+        """
+        groups: Dict[int, List[Tuple[Any, str, Future]]] = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), []).append(item)
+
+        for group in groups.values():
+            try:
+                save = functools.partial(group[0][0].save_memory, collection_name=self.collection_name,
+                                         data=[result for _, result, _ in group])
+            except Exception as e:
+                # E.g. a storage without save_memory; fail this group's results rather than the writer thread
+                for _, _, future in group:
+                    future.set_exception(e)
+                continue
+
+            try:
+                write = _STORAGE_POOL.submit(save)
+            except RuntimeError:
+                # The pool no longer accepts work once the interpreter is shutting down; write in place instead
+                write = Future()
+                try:
+                    write.set_result(save())
+                except Exception as e:
+                    write.set_exception(e)
+
+            with self._writes_lock:
+                self._writes.add(write)
+            write.add_done_callback(functools.partial(self._resolve, group))
+
+    def _resolve(self, group: List[Tuple[Any, str, Future]], write: Future) -> None:
+        """
+        Resolves the futures of a group of results once their storage write has finished.
+
+        Parameters:
+            group (List[Tuple[Any, str, Future]]): The results that were written.
+            write (Future): The finished storage write.
+        """
+        with self._writes_lock:
+            self._writes.discard(write)
+
+        error = write.exception()
+        for _, _, future in group:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(None)